@@ -18,13 +18,22 @@ Canvas: 4000 × 2800  |  Margin: 28px  |  Gap: 14px  |  Border-radius: 16px
 
 from __future__ import annotations
 
-import math
+import functools
+import mmap
+import os
 import re
+import threading
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    # Optional: Rust SIMD resizer (pip install cykooz.resizer)
+    from cykooz_resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+except ImportError:
+    Resizer = None
+
 from .director import BrandDirection, ColorSwatch
 from .generator import DirectionAssets
 from .palette_renderer import render_palette_cell, swatches_to_dicts
@@ -45,6 +54,13 @@ _ROW_H = [660, 740, 660, 642]
 # Inner width: 4000 - 2*28 = 3944
 _IW = CANVAS_W - 2 * MARGIN   # 3944
 
+# One reusable canvas per thread — reset in place instead of reallocating
+# ~33 MB for every direction.
+_CANVAS_POOL = threading.local()
+
+_TYPO_SPLIT = re.compile(r"[,:—–]")   # "Inter — geometric sans" → "Inter"
+_SLUG_RE    = re.compile(r"[^a-z0-9]+")
+
 
 def _grid() -> List[Tuple[str, int, int, int, int, Optional[int]]]:
     """
@@ -96,9 +112,16 @@ def _grid() -> List[Tuple[str, int, int, int, int, Optional[int]]]:
     return row1 + row2 + row3 + row4   # 4 + 3 + 4 + 3 = 14 cells
 
 
+# The layout is fixed — compute it once at import, not per direction.
+_GRID = tuple(_grid())
+
+
 # ── Font helpers ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=64)
 def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    # Cached: each cell asks for the same handful of sizes on every direction,
+    # and the candidate walk + FreeType face construction is ms-scale.
     for path in [
         "/System/Library/Fonts/HelveticaNeue.ttc",
         "/System/Library/Fonts/Helvetica.ttc",
@@ -113,11 +136,16 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_str: str) -> Tuple[int, int, int]:
+    # Cached: every cell of a direction re-reads the same few brand colors.
     h = hex_str.strip("#")
     if len(h) == 3:
         h = h[0] * 2 + h[1] * 2 + h[2] * 2
     try:
+        if len(h) == 6:
+            v = int(h, 16)
+            return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
         return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
     except ValueError:
         return (128, 128, 128)
@@ -131,46 +159,113 @@ def _contrasting_text(bg: Tuple[int, int, int]) -> Tuple[int, int, int]:
     return (255, 255, 255) if _brightness(bg) < 140 else (20, 20, 20)
 
 
+@functools.lru_cache(maxsize=4096)
+def _text_length(font: ImageFont.FreeTypeFont, s: str) -> float:
+    """Advance width of s in font, cached so repeated words are measured once."""
+    try:
+        return font.getlength(s)
+    except Exception:
+        return len(s) * (font.size // 2)
+
+
 def _wrap_pixels(
     text: str,
-    draw: ImageDraw.ImageDraw,
     font: ImageFont.FreeTypeFont,
     max_px: int,
-) -> List[str]:
-    """Word-wrap text to fit within max_px pixel width."""
+    with_widths: bool = False,
+) -> Union[List[str], List[Tuple[str, int]]]:
+    """
+    Word-wrap text to fit within max_px pixel width.
+
+    Each word is measured once and lines are laid out by summing word and
+    space advances, so no intermediate line strings are built or re-measured.
+    With with_widths=True, returns (line, width_px) pairs so callers that
+    center the lines can reuse the measurement.
+    """
     words = text.split()
-    lines: List[str] = []
-    current = ""
-    for word in words:
-        test = (current + " " + word).strip()
-        try:
-            tb = draw.textbbox((0, 0), test, font=font)
-            tw = tb[2] - tb[0]
-        except Exception:
-            tw = len(test) * (font.size // 2)
-        if tw <= max_px:
-            current = test
+    if not words:
+        lines = [(text, int(_text_length(font, text)))]
+        return lines if with_widths else [text]
+
+    space_w = _text_length(font, " ")
+    advances = [_text_length(font, word) for word in words]
+
+    lines: List[Tuple[str, int]] = []
+    start, line_w = 0, advances[0]
+    for i in range(1, len(words)):
+        candidate = line_w + space_w + advances[i]
+        if candidate <= max_px:
+            line_w = candidate
         else:
-            if current:
-                lines.append(current)
-            current = word
-    if current:
-        lines.append(current)
-    return lines or [text]
+            lines.append((" ".join(words[start:i]), int(line_w)))
+            start, line_w = i, advances[i]
+    lines.append((" ".join(words[start:]), int(line_w)))
+
+    if with_widths:
+        return lines
+    return [line for line, _ in lines]
 
 
 # ── Image fitting ─────────────────────────────────────────────────────────────
 
+# Targets at least this large on one side go through cykooz_resizer when it
+# is installed; smaller ones stay on Pillow, where the FFI hop isn't worth it.
+_FAST_RESIZE_MIN = 400
+
+
+def _resize(
+    img: Image.Image,
+    size: Tuple[int, int],
+    box: Optional[Tuple[float, float, float, float]] = None,
+    reducing_gap: Optional[float] = None,
+) -> Image.Image:
+    """
+    LANCZOS resize of img (or of the source region box) to size, routed
+    through cykooz_resizer for large targets.
+    """
+    if (
+        Resizer is not None
+        and max(size) >= _FAST_RESIZE_MIN
+        and img.mode in ("RGB", "RGBA")
+    ):
+        options = ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+        if box is not None:
+            left, top, right, bottom = box
+            options.crop_box = CropBox(left, top, right - left, bottom - top)
+        dst = Image.new(img.mode, size)
+        Resizer().resize_pil(img, dst, options)
+        return dst
+    return img.resize(size, Image.LANCZOS, box=box, reducing_gap=reducing_gap)
+
+
+def _open_image(path: Path) -> Image.Image:
+    """
+    Open an image through a read-only memory map.
+
+    The OS pages the file in on demand (and shares the pages between
+    processes) instead of Python buffering the whole file before decode.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return Image.open(mm)
+
+
 def _fit_cover(img: Image.Image, w: int, h: int) -> Image.Image:
-    """Resize to cover (w×h), center-crop the excess."""
+    """
+    Resize to cover (w×h), center-cropping the excess.
+
+    The crop is expressed as the source box handed to the resampler, so
+    crop and downscale happen in one pass with no oversized intermediate.
+    """
     iw, ih = img.size
     scale = max(w / iw, h / ih)
-    nw = math.ceil(iw * scale)
-    nh = math.ceil(ih * scale)
-    img = img.resize((nw, nh), Image.LANCZOS)
-    cx = (nw - w) // 2
-    cy = (nh - h) // 2
-    return img.crop((cx, cy, cx + w, cy + h))
+    bw, bh = w / scale, h / scale
+    bx, by = max(0.0, (iw - bw) / 2), max(0.0, (ih - bh) / 2)
+    # Large reductions (typical for mockup photos): box-reduce first so the
+    # LANCZOS pass only convolves ~3× the target size.
+    reducing_gap = 3.0 if scale < 0.5 else None
+    box = (bx, by, min(iw, bx + bw), min(ih, by + bh))
+    return _resize(img, (w, h), box=box, reducing_gap=reducing_gap)
 
 
 def _paste_rounded(
@@ -182,24 +277,41 @@ def _paste_rounded(
 ) -> None:
     """Paste cell_img onto canvas at (x,y) with rounded-corner mask."""
     w, h = cell_img.size
+    if cell_img.mode != "RGB":
+        # convert() always copies, so only pay for it on non-RGB cells
+        cell_img = cell_img.convert("RGB")
+    canvas.paste(cell_img, (x, y), _rounded_mask(w, h, radius))
+
+
+@functools.lru_cache(maxsize=32)
+def _rounded_mask(w: int, h: int, radius: int) -> Image.Image:
+    """
+    L-mode rounded-rect mask for a (w, h) cell.
+
+    The grid only has a handful of distinct cell sizes, so masks are built
+    once and shared — paste() never mutates its mask.
+    """
     mask = Image.new("L", (w, h), 0)
     ImageDraw.Draw(mask).rounded_rectangle(
         [0, 0, w - 1, h - 1], radius=radius, fill=255
     )
-    canvas.paste(cell_img.convert("RGB"), (x, y), mask)
+    return mask
 
 
 # ── Cell builders ─────────────────────────────────────────────────────────────
 
 def _cell_mockup(path: Optional[Path], w: int, h: int) -> Image.Image:
     """Mockup photo — cover-fit to fill cell."""
-    dark = Image.new("RGB", (w, h), (22, 22, 22))
-    if path is None or not path.exists():
-        return dark
-    try:
-        return _fit_cover(Image.open(path).convert("RGB"), w, h)
-    except Exception:
-        return dark
+    if path is not None and path.exists():
+        try:
+            im = _open_image(path)
+            # JPEG only: let libjpeg decode at a reduced DCT scale that still
+            # covers the cell (no-op for PNG and other formats).
+            im.draft("RGB", (w * 2, h * 2))
+            return _fit_cover(im.convert("RGB"), w, h)
+        except Exception:
+            pass
+    return Image.new("RGB", (w, h), (22, 22, 22))
 
 
 def _cell_logo(assets: DirectionAssets, w: int, h: int) -> Image.Image:
@@ -215,8 +327,7 @@ def _cell_logo(assets: DirectionAssets, w: int, h: int) -> Image.Image:
     font_opt = _load_font(22)
     opt_text = f"OPTION  {assets.direction.option_number}"
     try:
-        tb = draw.textbbox((0, 0), opt_text, font=font_opt)
-        tw = tb[2] - tb[0]
+        tw = int(font_opt.getlength(opt_text))
     except Exception:
         tw = len(opt_text) * 13
     draw.text(((w - tw) // 2, 34), opt_text, fill=primary_rgb, font=font_opt)
@@ -232,31 +343,25 @@ def _cell_logo(assets: DirectionAssets, w: int, h: int) -> Image.Image:
         and assets.logo.stat().st_size > 100
     ):
         try:
-            logo = Image.open(assets.logo).convert("RGBA")
+            logo = _open_image(assets.logo).convert("RGBA")
             lw, lh = logo.size
             max_w = w - PAD * 2
             scale = min(max_w / lw, logo_zone_h / lh) * 0.92
             nw = max(1, int(lw * scale))
             nh = max(1, int(lh * scale))
-            logo = logo.resize((nw, nh), Image.LANCZOS)
+            logo = _resize(logo, (nw, nh))
             lx = (w - nw) // 2
             ly = logo_zone_top + (logo_zone_h - nh) // 2
             img.paste(logo, (lx, ly), logo)
         except Exception:
             pass
-    draw = ImageDraw.Draw(img)
 
     # Direction name (bottom)
     font_name = _load_font(36)
     name = assets.direction.direction_name.upper()
-    lines = _wrap_pixels(name, draw, font_name, w - PAD * 2)
+    lines = _wrap_pixels(name, font_name, w - PAD * 2, with_widths=True)
     ty = h - name_reserve + 16
-    for line in lines[:2]:
-        try:
-            tb = draw.textbbox((0, 0), line, font=font_name)
-            tw = tb[2] - tb[0]
-        except Exception:
-            tw = len(line) * 22
+    for line, tw in lines[:2]:
         draw.text(((w - tw) // 2, ty), line, fill=(228, 228, 228), font=font_name)
         ty += 50
 
@@ -291,15 +396,17 @@ def _cell_pattern(assets: DirectionAssets, w: int, h: int) -> Image.Image:
         and assets.pattern.stat().st_size > 100
     ):
         try:
-            pat = Image.open(assets.pattern).convert("RGB")
-            pat_filled = _fit_cover(pat, w, h)
-            bg = Image.new("RGB", (w, h), bg_rgb)
-            img = Image.blend(bg, pat_filled, alpha=0.82)
+            pat = _open_image(assets.pattern)
+            pat.draft("RGB", (w * 2, h * 2))   # JPEG-only reduced decode
+            pat = pat.convert("RGB")
+            # img is already a flat bg_rgb fill — blend straight over it
+            img = Image.blend(img, _fit_cover(pat, w, h), alpha=0.82)
         except Exception:
             pass
 
+    font_label = _load_font(20)
     draw = ImageDraw.Draw(img)
-    draw.text((24, 24), "PATTERN", fill=(210, 210, 210), font=_load_font(20))
+    draw.text((24, 24), "PATTERN", fill=(210, 210, 210), font=font_label)
     return img
 
 
@@ -339,7 +446,7 @@ def _cell_info(direction: BrandDirection, w: int, h: int) -> Image.Image:
     # ── Direction name ────────────────────────────────────────────────────────
     font_title = _load_font(58)
     name = direction.direction_name.upper()
-    for line in _wrap_pixels(name, draw, font_title, w - PAD * 2):
+    for line in _wrap_pixels(name, font_title, w - PAD * 2):
         draw.text((PAD, y), line, fill=(238, 238, 238), font=font_title)
         y += 70
     y += 8
@@ -351,7 +458,7 @@ def _cell_info(direction: BrandDirection, w: int, h: int) -> Image.Image:
     # ── Rationale ─────────────────────────────────────────────────────────────
     font_body = _load_font(22)
     max_body_w = w - PAD * 2
-    for line in _wrap_pixels(direction.rationale, draw, font_body, max_body_w):
+    for line in _wrap_pixels(direction.rationale, font_body, max_body_w):
         if y + 30 > h - 90:
             break
         draw.text((PAD, y), line, fill=(155, 155, 168), font=font_body)
@@ -363,8 +470,8 @@ def _cell_info(direction: BrandDirection, w: int, h: int) -> Image.Image:
         draw.line([(PAD, y), (w // 3, y)], fill=(45, 45, 58), width=1)
         y += 16
         font_small = _load_font(18)
-        primary_name = re.split(r"[,:—–]", direction.typography_primary)[0].strip()
-        secondary_name = re.split(r"[,:—–]", direction.typography_secondary)[0].strip()
+        primary_name = _TYPO_SPLIT.split(direction.typography_primary)[0].strip()
+        secondary_name = _TYPO_SPLIT.split(direction.typography_secondary)[0].strip()
         draw.text(
             (PAD, y),
             f"TYPE  ·  {primary_name}  /  {secondary_name}",
@@ -377,6 +484,17 @@ def _cell_info(direction: BrandDirection, w: int, h: int) -> Image.Image:
 
 # ── Full stylescape assembly ──────────────────────────────────────────────────
 
+def _acquire_canvas() -> Image.Image:
+    """Return this thread's stylescape canvas, cleared to BG_COLOR."""
+    canvas = getattr(_CANVAS_POOL, "canvas", None)
+    if canvas is None:
+        canvas = Image.new("RGB", (CANVAS_W, CANVAS_H), BG_COLOR)
+        _CANVAS_POOL.canvas = canvas
+    else:
+        canvas.paste(BG_COLOR, (0, 0, CANVAS_W, CANVAS_H))
+    return canvas
+
+
 def assemble_stylescape(
     assets: DirectionAssets,
     output_dir: Path,
@@ -395,14 +513,14 @@ def assemble_stylescape(
     Returns:
         Path to the saved stylescape PNG.
     """
-    canvas = Image.new("RGB", (CANVAS_W, CANVAS_H), BG_COLOR)
+    canvas = _acquire_canvas()
 
     mockups = assets.mockups or []   # list of composited mockup paths
 
     def _slot(idx: int) -> Optional[Path]:
         return mockups[idx] if idx < len(mockups) else None
 
-    for cell in _grid():
+    for cell in _GRID:
         ctype, cx, cy, cw, ch, slot = cell
 
         if ctype == "mockup":
@@ -425,9 +543,11 @@ def assemble_stylescape(
 
         _paste_rounded(canvas, cell_img, cx, cy)
 
-    slug = re.sub(r"[^a-z0-9]+", "_", assets.direction.direction_name.lower()).strip("_")[:30]
+    slug = _SLUG_RE.sub("_", assets.direction.direction_name.lower()).strip("_")[:30]
     out_path = output_dir / f"stylescape_{assets.direction.option_number}_{slug}.png"
-    canvas.save(str(out_path), format="PNG")
+    # zlib level 1: several× faster encode than the default 6 on a 4000×2800
+    # canvas, for a modestly larger file.
+    canvas.save(str(out_path), format="PNG", compress_level=1, optimize=False)
     return out_path
 
 
@@ -449,6 +569,8 @@ def build_all_stylescapes(
     Returns:
         Dict mapping option_number → stylescape Path.
     """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
     from rich.console import Console
     console = Console()
 
@@ -462,12 +584,37 @@ def build_all_stylescapes(
             f"{assets.direction.direction_name}  "
             f"({n_mockups} mockups)[/cyan]"
         )
-        path = assemble_stylescape(
-            assets,
-            output_dir,
-            enriched_colors=getattr(assets, "enriched_colors", None),
-        )
-        stylescapes[num] = path
-        console.print(f"  [green]✓[/green] → {path.name}")
 
-    return stylescapes
+    # Each direction is an independent CPU-bound Pillow pipeline, so run them
+    # in separate processes. "spawn" avoids forking the bot's live threads.
+    max_workers = min(len(all_assets), os.cpu_count() or 1)
+    if max_workers <= 1:
+        for num, assets in all_assets.items():
+            stylescapes[num] = assemble_stylescape(
+                assets,
+                output_dir,
+                enriched_colors=getattr(assets, "enriched_colors", None),
+            )
+            console.print(f"  [green]✓[/green] → {stylescapes[num].name}")
+        return stylescapes
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = {
+            executor.submit(
+                assemble_stylescape,
+                assets,
+                output_dir,
+                enriched_colors=getattr(assets, "enriched_colors", None),
+            ): num
+            for num, assets in all_assets.items()
+        }
+        for future in as_completed(futures):
+            num = futures[future]
+            stylescapes[num] = future.result()
+            console.print(f"  [green]✓[/green] → {stylescapes[num].name}")
+
+    # Keep the caller's option order regardless of completion order
+    return {num: stylescapes[num] for num in all_assets}
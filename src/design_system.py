@@ -15,14 +15,19 @@ Can be integrated into the main pipeline or run standalone:
 
 from __future__ import annotations
 
+import base64
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 import colorsys
+import functools
+import io
 import re
 
+import numpy as np
 from google import genai
 from google.genai import types
 from rich.console import Console
@@ -34,7 +39,12 @@ console = Console()
 
 # ── Data models ────────────────────────────────────────────────────────────────
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+; on 3.9 the
+# models fall back to regular instances.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ColorToken:
     """Semantic color token with all format values."""
     token: str            # e.g. "--color-primary"
@@ -46,13 +56,15 @@ class ColorToken:
     usage: str = ""       # usage guidance
 
     def __post_init__(self):
-        if not self.hsl:
-            self.hsl = _hex_to_hsl(self.hex)
-        if not self.rgb:
-            self.rgb = _hex_to_rgb(self.hex)
+        if not (self.hsl and self.rgb):
+            rgb = _parse_hex(self.hex)   # parse once for both formats
+            if not self.hsl:
+                self.hsl = _rgb_to_hsl_str(rgb)
+            if not self.rgb:
+                self.rgb = _rgb_to_rgb_str(rgb)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TypeScale:
     """One level of the typography scale."""
     level: str            # H1, H2, H3, Body-L, Body-M, Caption
@@ -65,7 +77,7 @@ class TypeScale:
     usage: str            # where to use this level
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PatternVariant:
     """A specific use-case of the brand pattern."""
     name: str             # "hero", "surface", "accent"
@@ -76,7 +88,7 @@ class PatternVariant:
     usage: str            # when/where to use
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DesignSystem:
     """Complete design system for one brand direction."""
     direction_name: str
@@ -117,47 +129,156 @@ class DesignSystem:
 
 # ── Color utilities ────────────────────────────────────────────────────────────
 
-def _hex_to_hsl(hex_str: str) -> str:
-    """Convert hex color to HSL string."""
+@functools.lru_cache(maxsize=256)
+def _parse_hex(hex_str: str) -> Optional[tuple[int, int, int]]:
+    """Parse '#RRGGBB' into 0–255 ints; None if it isn't 6 hex digits long."""
     hex_str = hex_str.lstrip("#")
     if len(hex_str) != 6:
+        return None
+    return int(hex_str[0:2], 16), int(hex_str[2:4], 16), int(hex_str[4:6], 16)
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb_to_hsl_str(rgb: Optional[tuple[int, int, int]]) -> str:
+    """Format parsed RGB as an HSL string."""
+    if rgb is None:
         return "hsl(0, 0%, 50%)"
-    r, g, b = int(hex_str[0:2], 16) / 255, int(hex_str[2:4], 16) / 255, int(hex_str[4:6], 16) / 255
-    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    r, g, b = rgb
+    h, l, s = colorsys.rgb_to_hls(r / 255, g / 255, b / 255)
     return f"hsl({int(h*360)}, {int(s*100)}%, {int(l*100)}%)"
 
 
+def _rgb_to_rgb_str(rgb: Optional[tuple[int, int, int]]) -> str:
+    """Format parsed RGB as an RGB string."""
+    if rgb is None:
+        return "rgb(0, 0, 0)"
+    return "rgb({}, {}, {})".format(*rgb)
+
+
+def _hex_to_hsl(hex_str: str) -> str:
+    """Convert hex color to HSL string."""
+    return _rgb_to_hsl_str(_parse_hex(hex_str))
+
+
 def _hex_to_rgb(hex_str: str) -> str:
     """Convert hex color to RGB string."""
-    hex_str = hex_str.lstrip("#")
-    if len(hex_str) != 6:
-        return "rgb(0, 0, 0)"
-    r, g, b = int(hex_str[0:2], 16), int(hex_str[2:4], 16), int(hex_str[4:6], 16)
-    return f"rgb({r}, {g}, {b})"
+    return _rgb_to_rgb_str(_parse_hex(hex_str))
 
 
 def _is_dark(hex_str: str) -> bool:
     """Return True if the color is dark (luminance < 0.5)."""
-    hex_str = hex_str.lstrip("#")
-    if len(hex_str) != 6:
+    rgb = _parse_hex(hex_str)
+    if rgb is None:
         return False
-    r, g, b = int(hex_str[0:2], 16) / 255, int(hex_str[2:4], 16) / 255, int(hex_str[4:6], 16) / 255
-    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-    return luminance < 0.5
+    r, g, b = rgb
+    # 0.2126·R + 0.7152·G + 0.0722·B < 0.5 on 0–1 channels, scaled by 255·10⁴ to stay in ints
+    return 2126 * r + 7152 * g + 722 * b < 1_275_000
 
 
-def _derive_tints_shades(hex_str: str) -> dict:
-    """Derive 5 tints/shades for a color token."""
-    hex_str = hex_str.lstrip("#")
-    r, g, b = int(hex_str[0:2], 16) / 255, int(hex_str[2:4], 16) / 255, int(hex_str[4:6], 16) / 255
-    h, l, s = colorsys.rgb_to_hls(r, g, b)
+_TINT_LEVELS = ("100", "300", "500", "700", "900")
+_TINT_LIGHTNESS = np.array([0.95, 0.75, np.nan, 0.35, 0.15])  # nan → keep base lightness
+
+
+def _hex_array(hexes: List[str]) -> np.ndarray:
+    """Parse 6-digit hex strings into an (N, 3) float array of 0–1 RGB channels."""
+    rows = [_parse_hex(h) for h in hexes]   # each colour on its own — no shared buffer
+    if None in rows:
+        raise ValueError("_hex_array expects 6-digit hex colours")
+    return np.array(rows, dtype=np.float64).reshape(-1, 3) / 255.0
+
+
+def _rgb_to_hls_np(rgb: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised colorsys.rgb_to_hls over the last axis of an (..., 3) array."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    grey = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = (h / 6.0) % 1.0
+    return np.where(grey, 0.0, h), l, np.where(grey, 0.0, s)
+
+
+def _hls_to_rgb_np(h: np.ndarray, l: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Vectorised colorsys.hls_to_rgb; returns an (..., 3) array."""
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+
+    def _v(hue: np.ndarray) -> np.ndarray:
+        hue = hue % 1.0
+        return np.where(hue < 1.0 / 6.0, m1 + (m2 - m1) * hue * 6.0,
+               np.where(hue < 0.5, m2,
+               np.where(hue < 2.0 / 3.0, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0, m1)))
+
+    rgb = np.stack([_v(h + 1.0 / 3.0), _v(h), _v(h - 1.0 / 3.0)], axis=-1)
+    return np.where((s == 0.0)[..., None], l[..., None], rgb)
+
+
+_HEX6_RE = re.compile(r"[0-9a-f]{6}")
 
-    results = {}
-    for level, new_l in [("100", 0.95), ("300", 0.75), ("500", l), ("700", 0.35), ("900", 0.15)]:
+# Validated 6-digit hex ("1a2b3c") → ((level, "#RRGGBB"), ...); colours such as
+# the shared neutral recur across directions, so each is only derived once per run.
+# Only hexes that pass _HEX6_RE are stored — malformed values are recomputed each time.
+_TINT_CACHE: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+def _derive_tints_shades_scalar(digits: str) -> tuple[tuple[str, str], ...]:
+    """colorsys fallback for hex that isn't 6 clean digits — reads the first six
+    characters channel by channel, like the original per-token code did."""
+    r, g, b = int(digits[0:2], 16) / 255, int(digits[2:4], 16) / 255, int(digits[4:6], 16) / 255
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    results = []
+    for level, new_l in zip(_TINT_LEVELS, (0.95, 0.75, l, 0.35, 0.15)):
         nr, ng, nb = colorsys.hls_to_rgb(h, new_l, s)
-        hex_out = "#{:02X}{:02X}{:02X}".format(int(nr * 255), int(ng * 255), int(nb * 255))
-        results[level] = hex_out
-    return results
+        results.append((level, "#{:02X}{:02X}{:02X}".format(int(nr * 255), int(ng * 255), int(nb * 255))))
+    return tuple(results)
+
+
+def _derive_tints_shades_batch(hexes: List[str]) -> List[tuple[tuple[str, str], ...]]:
+    """Derive the 5 tints/shades for every hex; unseen colours share one vectorised pass."""
+    keys = [h.lstrip("#").lower() for h in hexes]
+    # Malformed LLM hex ("#12345", "#11223344") takes the scalar path so it can't
+    # shift the channels of the colours batched alongside it, and is never cached
+    fallback = {
+        k: _derive_tints_shades_scalar(k) for k in dict.fromkeys(keys) if not _HEX6_RE.fullmatch(k)
+    }
+    missing = list(dict.fromkeys(k for k in keys if k not in fallback and k not in _TINT_CACHE))
+    if missing:
+        h, l, s = _rgb_to_hls_np(_hex_array(missing))
+        # (N, 5) lightness grid: fixed levels, with the 500 column keeping each colour's own L
+        grid_l = np.where(np.isnan(_TINT_LIGHTNESS), l[:, None], _TINT_LIGHTNESS)
+        rgb = _hls_to_rgb_np(
+            np.broadcast_to(h[:, None], grid_l.shape),
+            grid_l,
+            np.broadcast_to(s[:, None], grid_l.shape),
+        )
+        ints = (rgb * 255).astype(np.int64)  # truncate like int(x * 255)
+        for key, row in zip(missing, ints.tolist()):
+            _TINT_CACHE[key] = tuple(
+                (level, "#{:02X}{:02X}{:02X}".format(*px)) for level, px in zip(_TINT_LEVELS, row)
+            )
+    return [fallback[k] if k in fallback else _TINT_CACHE[k] for k in keys]
+
+
+def _derive_tints_shades(hex_str: str) -> tuple[tuple[str, str], ...]:
+    """Derive 5 tints/shades for a color token as (level, hex) pairs."""
+    return _derive_tints_shades_batch([hex_str])[0]
+
+
+_SLUG_RE = re.compile(r"\W+")
+
+
+@functools.lru_cache(maxsize=256)
+def _slug(name: str) -> str:
+    """File-name slug for a direction name (shared by patterns and rulebook)."""
+    return _SLUG_RE.sub("_", name.lower()).strip("_")
 
 
 # ── Font recommendations ───────────────────────────────────────────────────────
@@ -175,35 +296,55 @@ FONT_PAIRINGS = {
 }
 
 
-def _pick_font_pairing(direction: BrandDirection) -> tuple[str, str, str]:
+# Keyword cues, checked in priority order. Plain alternations (no \b) keep the
+# original substring semantics, e.g. "fun" still matches "functional".
+_FONT_CUES = (
+    ("luxury",    re.compile("luxury|premium|editorial|couture|haute")),
+    ("retro",     re.compile("retro|vintage|classic|nostalgic")),
+    ("tech",      re.compile("tech|futuristic|cyber|digital|code")),
+    ("bold",      re.compile("bold|brutalist|strong|impact|heavy")),
+    ("playful",   re.compile("playful|mascot|fun|friendly|cute")),
+    ("organic",   re.compile("organic|natural|botanical|eco")),
+    ("elegant",   re.compile("elegant|serif|typographic|fashion")),
+    ("corporate", re.compile("corporate|enterprise|professional|b2b")),
+)
+_EDITORIAL_CUES = re.compile("editorial|luxury|elegant")
+_TIGHT_CUES = re.compile("minimal|geometric|tech|futuristic")
+_GEOMETRIC_CUES = re.compile("geometric|angular|grid|structured")
+_ORGANIC_CUES = re.compile("organic|flowing|curve|natural|fluid")
+_ROUNDED_CUES = re.compile("round|soft|organic|curve")
+_SHARP_CUES = re.compile("sharp|angular|geometric|brutalist")
+
+
+def _style_text_lc(direction: BrandDirection) -> str:
+    """Lower-cased style + name + rationale text used for font-pairing cues."""
+    return f"{direction.graphic_style} {direction.direction_name} {direction.rationale}".lower()
+
+
+def _pick_font_pairing(
+    direction: BrandDirection,
+    style_text_lc: Optional[str] = None,
+) -> tuple[str, str, str]:
     """Pick the best Google Fonts pairing based on direction style cues."""
-    style_text = f"{direction.graphic_style} {direction.direction_name} {direction.rationale}".lower()
-
-    if any(k in style_text for k in ("luxury", "premium", "editorial", "couture", "haute")):
-        return FONT_PAIRINGS["luxury"]
-    if any(k in style_text for k in ("retro", "vintage", "classic", "nostalgic")):
-        return FONT_PAIRINGS["retro"]
-    if any(k in style_text for k in ("tech", "futuristic", "cyber", "digital", "code")):
-        return FONT_PAIRINGS["tech"]
-    if any(k in style_text for k in ("bold", "brutalist", "strong", "impact", "heavy")):
-        return FONT_PAIRINGS["bold"]
-    if any(k in style_text for k in ("playful", "mascot", "fun", "friendly", "cute")):
-        return FONT_PAIRINGS["playful"]
-    if any(k in style_text for k in ("organic", "natural", "botanical", "eco")):
-        return FONT_PAIRINGS["organic"]
-    if any(k in style_text for k in ("elegant", "serif", "typographic", "fashion")):
-        return FONT_PAIRINGS["elegant"]
-    if any(k in style_text for k in ("corporate", "enterprise", "professional", "b2b")):
-        return FONT_PAIRINGS["corporate"]
+    if style_text_lc is None:
+        style_text_lc = _style_text_lc(direction)
+    return _pick_font_pairing_cached(style_text_lc)
+
+
+@functools.lru_cache(maxsize=128)
+def _pick_font_pairing_cached(style_text_lc: str) -> tuple[str, str, str]:
+    for key, cue in _FONT_CUES:
+        if cue.search(style_text_lc):
+            return FONT_PAIRINGS[key]
     return FONT_PAIRINGS["minimal"]
 
 
 # ── Type scale builder ─────────────────────────────────────────────────────────
 
-def _build_type_scale(primary_font: str, secondary_font: str, style_cues: str) -> List[TypeScale]:
-    """Build a complete typographic scale for this direction."""
-    is_editorial = any(k in style_cues.lower() for k in ("editorial", "luxury", "elegant"))
-    tight_spacing = any(k in style_cues.lower() for k in ("minimal", "geometric", "tech", "futuristic"))
+def _build_type_scale(primary_font: str, secondary_font: str, style_cues_lc: str) -> List[TypeScale]:
+    """Build a complete typographic scale for this direction (style cues lower-cased)."""
+    is_editorial = _EDITORIAL_CUES.search(style_cues_lc) is not None
+    tight_spacing = _TIGHT_CUES.search(style_cues_lc) is not None
 
     return [
         TypeScale("Display", 72, 96, 1.0, "-0.04em", primary_font, "700",
@@ -229,8 +370,14 @@ def _build_type_scale(primary_font: str, secondary_font: str, style_cues: str) -
 
 # ── Spacing system ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4)
 def _build_spacing_system(base: int = 4) -> tuple[dict, dict]:
-    """Build a 4pt grid spacing scale and border radius system."""
+    """
+    Build a 4pt grid spacing scale and border radius system.
+
+    Cached per base — the returned dicts are shared between design systems,
+    so treat them as read-only.
+    """
     spacing = {
         "xs":  base,        # 4px — tight spacing, icon padding
         "sm":  base * 2,    # 8px — component internal padding
@@ -254,7 +401,10 @@ def _build_spacing_system(base: int = 4) -> tuple[dict, dict]:
 
 # ── Pattern variants ───────────────────────────────────────────────────────────
 
-def _build_pattern_variants(direction: BrandDirection) -> List[PatternVariant]:
+def _build_pattern_variants(
+    direction: BrandDirection,
+    style_cues_lc: Optional[str] = None,
+) -> List[PatternVariant]:
     """Define 3 pattern use cases from the direction's graphic style."""
     palette = direction.colors
     if not palette:
@@ -264,9 +414,10 @@ def _build_pattern_variants(direction: BrandDirection) -> List[PatternVariant]:
     secondary_hex = palette[1].hex if len(palette) > 1 else palette[0].hex
     accent_hex = palette[2].hex if len(palette) > 2 else palette[0].hex
 
-    style_cues = direction.graphic_style.lower()
-    is_geometric = any(k in style_cues for k in ("geometric", "angular", "grid", "structured"))
-    is_organic = any(k in style_cues for k in ("organic", "flowing", "curve", "natural", "fluid"))
+    if style_cues_lc is None:
+        style_cues_lc = direction.graphic_style.lower()
+    is_geometric = _GEOMETRIC_CUES.search(style_cues_lc) is not None
+    is_organic = _ORGANIC_CUES.search(style_cues_lc) is not None
 
     if is_geometric:
         hero_desc = f"Large-scale geometric grid pattern — repeat unit 120px, {primary_hex} strokes on {secondary_hex} fill"
@@ -311,6 +462,79 @@ def _build_pattern_variants(direction: BrandDirection) -> List[PatternVariant]:
 
 # ── Generate pattern images ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> genai.Client:
+    """Shared Gemini client per API key, so connections are reused across calls."""
+    return genai.Client(api_key=api_key)
+
+
+def _call_imagen(client: genai.Client, model_id: str, prompt: str) -> Optional[bytes]:
+    response = client.models.generate_images(
+        model=model_id,
+        prompt=prompt,
+        config=types.GenerateImagesConfig(number_of_images=1, aspect_ratio="1:1"),
+    )
+    if response.generated_images:
+        return response.generated_images[0].image.image_data
+    return None
+
+
+def _call_gemini(client: genai.Client, model_id: str, prompt: str) -> Optional[bytes]:
+    resp = client.models.generate_content(
+        model=model_id,
+        contents=prompt,
+        config=types.GenerateContentConfig(response_modalities=["IMAGE", "TEXT"]),
+    )
+    inline_parts = (
+        getattr(p, "inline_data", None)
+        for c in (resp.candidates or [])
+        for p in (c.content.parts or [])
+    )
+    first = next((x for x in inline_parts if x), None)
+    if first is None:
+        return None
+    data = first.data
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    return data
+
+
+# (model, log label, call) — tried in order until one returns image bytes.
+# Imagen 3 first, then Gemini image models as fallback.
+_PATTERN_ATTEMPTS = (
+    ("imagen-3.0-generate-002", "Imagen 3", _call_imagen),
+    ("gemini-2.5-flash-image", "2.5", _call_gemini),
+    ("gemini-2.0-flash-exp-image-generation", "2.0", _call_gemini),
+)
+
+
+# Variant prompt templates: {base} is the palette/style prompt, {primary} and
+# {accent} the first and last palette hex. Second element is the target opacity.
+_VARIANT_TEMPLATES = {
+    "hero": (
+        "Large-scale seamless repeating pattern. {base} "
+        "Geometric or organic motif at 100px repeat unit. Strong, recognizable. "
+        "Primary color {primary} dominant. "
+        "Square tile, flat vector, NO text, NO logos, NO letterforms.",
+        1.0,
+    ),
+    "surface": (
+        "Ultra-subtle micro texture. {base} "
+        "Very fine pattern at 12px repeat — dots, lines, or crosshatch. "
+        "5% opacity effect on white background. Barely visible, adds texture not color. "
+        "Square tile, seamless, NO text.",
+        0.4,
+    ),
+    "accent": (
+        "Medium-scale brand pattern. {base} "
+        "Mix of primary {primary} and accent {accent}. "
+        "Bold and graphic. Used as partial overlays on social posts. "
+        "Square tile, seamless, NO text, NO logos.",
+        0.7,
+    ),
+}
+
+
 def generate_pattern_images(
     direction: BrandDirection,
     output_dir: Path,
@@ -320,93 +544,58 @@ def generate_pattern_images(
     Generate 3 pattern PNG images for this direction using Gemini.
     Returns {'hero': Path, 'surface': Path, 'accent': Path}
     """
-    results: dict[str, Optional[Path]] = {}
     output_dir.mkdir(parents=True, exist_ok=True)
 
     palette_str = ", ".join(f"{c.hex}" for c in direction.colors)
-    slug = re.sub(r"\W+", "_", direction.direction_name.lower()).strip("_")
+    slug = _slug(direction.direction_name)
     base_prompt = (
         f"Brand palette: {palette_str}. "
         f"Style: {direction.graphic_style[:120]}. "
     )
 
+    primary_hex = direction.colors[0].hex
     variants = {
-        "hero": (
-            f"Large-scale seamless repeating pattern. {base_prompt} "
-            f"Geometric or organic motif at 100px repeat unit. Strong, recognizable. "
-            f"Primary color {direction.colors[0].hex} dominant. "
-            f"Square tile, flat vector, NO text, NO logos, NO letterforms.",
-            1.0,
-        ),
-        "surface": (
-            f"Ultra-subtle micro texture. {base_prompt} "
-            f"Very fine pattern at 12px repeat — dots, lines, or crosshatch. "
-            f"5% opacity effect on white background. Barely visible, adds texture not color. "
-            f"Square tile, seamless, NO text.",
-            0.4,
-        ),
-        "accent": (
-            f"Medium-scale brand pattern. {base_prompt} "
-            f"Mix of primary {direction.colors[0].hex} and accent "
-            f"{direction.colors[-1].hex if len(direction.colors) > 1 else direction.colors[0].hex}. "
-            f"Bold and graphic. Used as partial overlays on social posts. "
-            f"Square tile, seamless, NO text, NO logos.",
-            0.7,
-        ),
+        name: tmpl.format(base=base_prompt, primary=primary_hex, accent=direction.colors[-1].hex)
+        for name, (tmpl, _opacity) in _VARIANT_TEMPLATES.items()
     }
 
-    for name, (prompt, _opacity) in variants.items():
-        save_path = output_dir / f"pattern_{slug}_{name}.png"
+    results: dict[str, Optional[Path]] = {name: None for name in variants}
+    try:
+        client = _get_client(api_key)
+    except Exception as e:
+        console.print(f"  [yellow]⚠ pattern generation failed: {e}[/yellow]")
+        return results
 
-        try:
-            client = genai.Client(api_key=api_key)
+    def _gen_one(name: str, prompt: str) -> Optional[Path]:
+        """Generate one pattern variant (runs in a worker thread)."""
+        save_path = output_dir / f"pattern_{slug}_{name}.png"
 
-            # Try Imagen 3 first
-            response = client.models.generate_images(
-                model="imagen-3.0-generate-002",
-                prompt=prompt,
-                config=types.GenerateImagesConfig(number_of_images=1, aspect_ratio="1:1"),
-            )
-            if response.generated_images:
-                save_path.write_bytes(response.generated_images[0].image.image_data)
-                console.print(f"  [green]✓ pattern/{name}[/green] (Imagen 3) → {save_path.name}")
-                results[name] = save_path
+        for model_id, label, call in _PATTERN_ATTEMPTS:
+            try:
+                data = call(client, model_id, prompt)
+            except Exception:
                 continue
-        except Exception:
-            pass
-
-        # Fallback: Gemini 2.0 Flash
-        try:
-            client = genai.Client(api_key=api_key)
-            for model_id in ["gemini-2.5-flash-image", "gemini-2.0-flash-exp-image-generation"]:
-                try:
-                    resp = client.models.generate_content(
-                        model=model_id,
-                        contents=prompt,
-                        config=types.GenerateContentConfig(response_modalities=["IMAGE", "TEXT"]),
-                    )
-                    for candidate in resp.candidates or []:
-                        for part in candidate.content.parts or []:
-                            if hasattr(part, "inline_data") and part.inline_data:
-                                import base64
-                                data = part.inline_data.data
-                                if isinstance(data, str):
-                                    data = base64.b64decode(data)
-                                save_path.write_bytes(data)
-                                console.print(f"  [green]✓ pattern/{name}[/green] ({model_id.split('-')[1]}) → {save_path.name}")
-                                results[name] = save_path
-                                break
-                        if name in results:
-                            break
-                    if name in results:
-                        break
-                except Exception:
-                    continue
-        except Exception as e:
-            console.print(f"  [yellow]⚠ pattern/{name} failed: {e}[/yellow]")
-
-        if name not in results:
-            results[name] = None
+            if data:
+                save_path.write_bytes(data)
+                console.print(f"  [green]✓ pattern/{name}[/green] ({label}) → {save_path.name}")
+                return save_path
+        return None
+
+    # The three variants are independent network calls — run them concurrently
+    # on one shared client.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = {
+            executor.submit(_gen_one, name, prompt): name
+            for name, prompt in variants.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                console.print(f"  [yellow]⚠ pattern/{name} failed: {e}[/yellow]")
 
     return results
 
@@ -415,13 +604,22 @@ def generate_pattern_images(
 
 def _build_rulebook(ds: DesignSystem) -> str:
     """Generate a complete Markdown design system rulebook."""
+    buf = io.StringIO()
+    write = buf.write
 
+    write(f"""# {ds.direction_name} — Brand Design System
+*Option {ds.option_number} · {ds.option_type}*
+
+---
+
+## Color System
+
+""")
     # Color section
-    color_lines = []
-    for token in ds.color_tokens:
-        tints = _derive_tints_shades(token.hex)
-        tint_row = " | ".join(f"`{k}` {v}" for k, v in tints.items())
-        color_lines.append(
+    all_tints = _derive_tints_shades_batch([t.hex for t in ds.color_tokens])
+    for token, tints in zip(ds.color_tokens, all_tints):
+        tint_row = " | ".join(f"`{k}` {v}" for k, v in tints)
+        write(
             f"### {token.name} — `{token.token}`\n"
             f"- **HEX**: `{token.hex}`\n"
             f"- **HSL**: `{token.hsl}`\n"
@@ -429,48 +627,18 @@ def _build_rulebook(ds: DesignSystem) -> str:
             f"- **Role**: {token.role}\n"
             f"- **Usage**: {token.usage}\n"
             f"- **Shades**: {tint_row}\n"
+            "\n"
         )
 
-    # Typography section
-    type_lines = ["| Level | Size | Line-Height | Letter-Spacing | Weight | Font | Usage |",
-                  "|-------|------|-------------|----------------|--------|------|-------|"]
-    for ts in ds.type_scale:
-        type_lines.append(
-            f"| {ts.level} | {ts.size_px}px / {ts.size_pt}pt | {ts.line_height} | "
-            f"`{ts.letter_spacing}` | {ts.weight} | {ts.font_family} | {ts.usage} |"
-        )
-
-    # Spacing section
-    spacing_lines = ["| Token | Value | Usage |", "|-------|-------|-------|"]
-    for tok, val in ds.spacing_scale.items():
-        spacing_lines.append(f"| `spacing-{tok}` | {val}px | — |")
-
-    # Pattern section
-    pattern_lines = []
-    for pv in ds.pattern_variants:
-        pattern_lines.append(
-            f"### Pattern: {pv.name.title()}\n"
-            f"- **Scale**: {pv.scale}\n"
-            f"- **Colors**: {', '.join(pv.colors)}\n"
-            f"- **Opacity**: {int(pv.opacity * 100)}%\n"
-            f"- **Description**: {pv.description}\n"
-            f"- **Use when**: {pv.usage}\n"
-        )
-
-    return f"""# {ds.direction_name} — Brand Design System
-*Option {ds.option_number} · {ds.option_type}*
-
----
-
-## Color System
-
-{chr(10).join(color_lines)}
-
+    write("""
 ### CSS Custom Properties
 ```css
-:root {{
-{chr(10).join(f'  {t.token}: {t.hex};' for t in ds.color_tokens)}
-}}
+:root {
+""")
+    buf.writelines(f"  {t.token}: {t.hex};\n" for t in ds.color_tokens)
+
+    # Typography section
+    write(f"""}}
 ```
 
 ---
@@ -487,13 +655,22 @@ def _build_rulebook(ds: DesignSystem) -> str:
 
 ### Type Scale
 
-{chr(10).join(type_lines)}
+| Level | Size | Line-Height | Letter-Spacing | Weight | Font | Usage |
+|-------|------|-------------|----------------|--------|------|-------|
+""")
+    buf.writelines(
+        f"| {ts.level} | {ts.size_px}px / {ts.size_pt}pt | {ts.line_height} | "
+        f"`{ts.letter_spacing}` | {ts.weight} | {ts.font_family} | {ts.usage} |\n"
+        for ts in ds.type_scale
+    )
 
+    # Spacing section
+    write(f"""
 ### CSS Typography Tokens
 ```css
 :root {{
-{chr(10).join(f'  --font-primary: "{ds.primary_font}", sans-serif;')}
-{chr(10).join(f'  --font-secondary: "{ds.secondary_font}", sans-serif;')}
+  --font-primary: "{ds.primary_font}", sans-serif;
+  --font-secondary: "{ds.secondary_font}", sans-serif;
 }}
 ```
 
@@ -503,20 +680,37 @@ def _build_rulebook(ds: DesignSystem) -> str:
 
 **Base unit**: {ds.base_unit}px grid
 
-{chr(10).join(spacing_lines)}
-
+| Token | Value | Usage |
+|-------|-------|-------|
+""")
+    buf.writelines(f"| `spacing-{tok}` | {val}px | — |\n" for tok, val in ds.spacing_scale.items())
+    write(f"""
 **Max content width**: {ds.max_width}px
 **Border radius system**:
-{chr(10).join(f'- `radius-{k}`: {v}' for k, v in ds.border_radius.items())}
+""")
+    buf.writelines(f"- `radius-{k}`: {v}\n" for k, v in ds.border_radius.items())
 
+    # Pattern section
+    write(f"""
 ---
 
 ## Pattern System
 
 {ds.pattern_description}
 
-{chr(10).join(pattern_lines)}
+""")
+    for pv in ds.pattern_variants:
+        write(
+            f"### Pattern: {pv.name.title()}\n"
+            f"- **Scale**: {pv.scale}\n"
+            f"- **Colors**: {', '.join(pv.colors)}\n"
+            f"- **Opacity**: {int(pv.opacity * 100)}%\n"
+            f"- **Description**: {pv.description}\n"
+            f"- **Use when**: {pv.usage}\n"
+            "\n"
+        )
 
+    write(f"""
 ---
 
 ## Shape Language
@@ -546,7 +740,8 @@ def _build_rulebook(ds: DesignSystem) -> str:
 ---
 
 *Generated by Brand Identity Generator · Design System v1.0*
-"""
+""")
+    return buf.getvalue()
 
 
 # ── Main builder ───────────────────────────────────────────────────────────────
@@ -555,6 +750,8 @@ def build_design_system(
     direction: BrandDirection,
     output_dir: Path,
     generate_patterns: bool = True,
+    write_rulebook: bool = True,
+    write_tokens_json: bool = True,
 ) -> DesignSystem:
     """
     Build a complete design system for one brand direction.
@@ -563,13 +760,16 @@ def build_design_system(
         direction:           BrandDirection from director.py
         output_dir:          Directory to save pattern images and rulebook
         generate_patterns:   Whether to call Gemini to generate pattern PNGs
+        write_rulebook:      Build ds.rulebook_md and save it as Markdown
+                             (left empty when False)
+        write_tokens_json:   Save the tokens JSON for Figma/dev handoff
 
     Returns:
         DesignSystem dataclass with all tokens, specs, and file paths
     """
     api_key = os.environ.get("GEMINI_API_KEY", "")
     output_dir.mkdir(parents=True, exist_ok=True)
-    slug = re.sub(r"\W+", "_", direction.direction_name.lower()).strip("_")
+    slug = _slug(direction.direction_name)
     patterns_dir = output_dir / "patterns"
     patterns_dir.mkdir(exist_ok=True)
 
@@ -599,8 +799,8 @@ def build_design_system(
         color_tokens.append(token)
 
     # Always ensure a neutral and background token exist
-    hex_values = [t.hex for t in color_tokens]
-    if not any(t.role == "neutral" for t in color_tokens) and len(color_tokens) >= 2:
+    present_roles = {t.role for t in color_tokens}
+    if "neutral" not in present_roles and len(color_tokens) >= 2:
         color_tokens.append(ColorToken(
             token="--color-neutral",
             name="Neutral",
@@ -608,7 +808,7 @@ def build_design_system(
             role="neutral",
             usage="Body text, borders, disabled states",
         ))
-    if not any(t.role == "background" for t in color_tokens):
+    if "background" not in present_roles:
         bg_hex = "#F9FAFB" if not _is_dark(color_tokens[0].hex) else "#111827"
         color_tokens.append(ColorToken(
             token="--color-background",
@@ -618,23 +818,24 @@ def build_design_system(
             usage="Page and section backgrounds",
         ))
 
+    # Lower-case the style cues once and share them across the builders below
+    style_cues_lc = direction.graphic_style.lower()
+
     # ── 2. Typography ─────────────────────────────────────────────────────────
-    primary_font, secondary_font, gfonts_url = _pick_font_pairing(direction)
-    style_cues = direction.graphic_style
-    type_scale = _build_type_scale(primary_font, secondary_font, style_cues)
+    primary_font, secondary_font, gfonts_url = _pick_font_pairing(direction, _style_text_lc(direction))
+    type_scale = _build_type_scale(primary_font, secondary_font, style_cues_lc)
 
     # ── 3. Spacing ────────────────────────────────────────────────────────────
     spacing, border_radius = _build_spacing_system(base=4)
 
     # ── 4. Pattern metadata ───────────────────────────────────────────────────
-    pattern_variants = _build_pattern_variants(direction)
+    pattern_variants = _build_pattern_variants(direction, style_cues_lc)
 
     is_dark_brand = _is_dark(color_tokens[0].hex)
-    shape_cues = direction.graphic_style
-    if any(k in shape_cues.lower() for k in ("round", "soft", "organic", "curve")):
+    if _ROUNDED_CUES.search(style_cues_lc):
         shape_lang = "Rounded, soft geometry. Prefer `border-radius: 16px` for cards, `border-radius: 999px` for pills and badges."
         icon_style = "Outlined icons with rounded caps and joins. Stroke weight: 1.5px. Prefer Lucide or Heroicons (rounded variant)."
-    elif any(k in shape_cues.lower() for k in ("sharp", "angular", "geometric", "brutalist")):
+    elif _SHARP_CUES.search(style_cues_lc):
         shape_lang = "Hard-edged, zero-radius geometry. Cards and containers use `border-radius: 0` or max `4px`. Angular cuts welcome."
         icon_style = "Sharp-edged icons, no rounded corners. Stroke weight: 2px. Prefer Material Icons (sharp variant) or Phosphor Icons."
     else:
@@ -672,36 +873,40 @@ def build_design_system(
         console.print("  [dim]Skipping pattern generation (no API key or disabled)[/dim]")
 
     # ── 7. Build rulebook ─────────────────────────────────────────────────────
-    ds.rulebook_md = _build_rulebook(ds)
-    rulebook_path = output_dir / f"design_system_{slug}.md"
-    rulebook_path.write_text(ds.rulebook_md, encoding="utf-8")
-    console.print(f"  [green]✓ Rulebook saved[/green] → {rulebook_path.name}")
+    if write_rulebook:
+        ds.rulebook_md = _build_rulebook(ds)
+        rulebook_path = output_dir / f"design_system_{slug}.md"
+        with rulebook_path.open("w", encoding="utf-8", buffering=64 * 1024) as f:
+            f.write(ds.rulebook_md)
+        console.print(f"  [green]✓ Rulebook saved[/green] → {rulebook_path.name}")
 
     # ── 8. Save tokens as JSON (for Figma/dev handoff) ────────────────────────
-    tokens_data = {
-        "colors": {t.token.lstrip("--"): {"hex": t.hex, "hsl": t.hsl, "rgb": t.rgb, "role": t.role} for t in ds.color_tokens},
-        "typography": {
-            "primary_font": ds.primary_font,
-            "secondary_font": ds.secondary_font,
-            "google_fonts_url": ds.google_fonts_url,
-            "scale": [
-                {"level": ts.level, "size_px": ts.size_px, "size_pt": ts.size_pt,
-                 "line_height": ts.line_height, "letter_spacing": ts.letter_spacing,
-                 "weight": ts.weight, "font": ts.font_family}
-                for ts in ds.type_scale
-            ],
-        },
-        "spacing": {f"spacing-{k}": f"{v}px" for k, v in ds.spacing_scale.items()},
-        "border_radius": {f"radius-{k}": v for k, v in ds.border_radius.items()},
-        "patterns": {
-            "hero": str(ds.pattern_hero_path) if ds.pattern_hero_path else None,
-            "surface": str(ds.pattern_surface_path) if ds.pattern_surface_path else None,
-            "accent": str(ds.pattern_accent_path) if ds.pattern_accent_path else None,
-        },
-    }
-    tokens_path = output_dir / f"tokens_{slug}.json"
-    tokens_path.write_text(json.dumps(tokens_data, indent=2), encoding="utf-8")
-    console.print(f"  [green]✓ Tokens JSON saved[/green] → {tokens_path.name}")
+    if write_tokens_json:
+        tokens_data = {
+            "colors": {t.token.lstrip("--"): {"hex": t.hex, "hsl": t.hsl, "rgb": t.rgb, "role": t.role} for t in ds.color_tokens},
+            "typography": {
+                "primary_font": ds.primary_font,
+                "secondary_font": ds.secondary_font,
+                "google_fonts_url": ds.google_fonts_url,
+                "scale": [
+                    {"level": ts.level, "size_px": ts.size_px, "size_pt": ts.size_pt,
+                     "line_height": ts.line_height, "letter_spacing": ts.letter_spacing,
+                     "weight": ts.weight, "font": ts.font_family}
+                    for ts in ds.type_scale
+                ],
+            },
+            "spacing": {f"spacing-{k}": f"{v}px" for k, v in ds.spacing_scale.items()},
+            "border_radius": {f"radius-{k}": v for k, v in ds.border_radius.items()},
+            "patterns": {
+                "hero": str(ds.pattern_hero_path) if ds.pattern_hero_path else None,
+                "surface": str(ds.pattern_surface_path) if ds.pattern_surface_path else None,
+                "accent": str(ds.pattern_accent_path) if ds.pattern_accent_path else None,
+            },
+        }
+        tokens_path = output_dir / f"tokens_{slug}.json"
+        with tokens_path.open("w", encoding="utf-8", buffering=64 * 1024) as f:
+            json.dump(tokens_data, f, indent=2)
+        console.print(f"  [green]✓ Tokens JSON saved[/green] → {tokens_path.name}")
 
     return ds
 
@@ -712,14 +917,28 @@ def build_all_design_systems(
     directions: list,
     base_output_dir: Path,
     generate_patterns: bool = True,
+    write_rulebook: bool = True,
+    write_tokens_json: bool = True,
 ) -> List[DesignSystem]:
     """
     Build design systems for all brand directions.
     Called from main pipeline after generate_all_assets().
     """
-    systems = []
-    for direction in directions:
+    if not directions:
+        return []
+
+    def _build_one(direction) -> DesignSystem:
         dir_output = base_output_dir / f"direction_{direction.option_number}"
-        ds = build_design_system(direction, dir_output, generate_patterns=generate_patterns)
-        systems.append(ds)
-    return systems
+        return build_design_system(
+            direction, dir_output,
+            generate_patterns=generate_patterns,
+            write_rulebook=write_rulebook,
+            write_tokens_json=write_tokens_json,
+        )
+
+    # Directions are independent and mostly wait on Gemini pattern calls —
+    # overlap them like generator.py does for asset generation.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(directions), 4)) as executor:
+        return list(executor.map(_build_one, directions))
@@ -14,8 +14,14 @@ Each direction includes:
 from __future__ import annotations
 
 import base64
+import copy
+import functools
+import hashlib
 import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import List, Literal, Optional
 
@@ -253,6 +259,15 @@ class BrandDirectionsOutput(BaseModel):
     )
 
 
+# Pydantic regenerates the JSON schema on every model_json_schema() call, and the
+# SDK calls it for each request when given the model class — derive it once and
+# hand the SDK a fresh copy per request (its schema processing mutates the dict).
+_DIRECTIONS_JSON_SCHEMA: dict = BrandDirectionsOutput.model_json_schema()
+
+# Logo types that render the brand name as type — text must not be banned for these
+TEXT_LOGO_TYPES = frozenset({"logotype", "combination"})
+
+
 # ── ConceptCore removed — concept ideation is now handled internally by the
 # ── Director system prompt (Phase 1). No separate pre-pass call needed.
 
@@ -657,23 +672,57 @@ _INDUSTRY_KEYWORD_MAP: dict = {
     "wellness": "wellness", "yoga": "wellness", "spa": "wellness",
 }
 
+_INDUSTRY_COUNT = len(set(_INDUSTRY_KEYWORD_MAP.values()))
+
+# One regex pass finds every keyword in the brief. The zero-width lookahead tries
+# every position; longest-first ordering makes each position report its longest
+# keyword, and shorter keywords contained in it ("tech" in "fintech", "app" in
+# "apparel") are folded back in through _KEYWORD_SUBSUMES — same hits as a
+# substring test per keyword.
+_INDUSTRY_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_INDUSTRY_KEYWORD_MAP, key=len, reverse=True))
+    + "))"
+)
+_KEYWORD_SUBSUMES: dict = {
+    k: tuple(other for other in _INDUSTRY_KEYWORD_MAP if other != k and other in k)
+    for k in _INDUSTRY_KEYWORD_MAP
+}
 
-def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
-    """
-    Analyse brief to identify industry, then return a constraint block with:
-    - Clichés to AVOID (hard rule)
-    - Lateral territories to EXPLORE (creative direction)
+# Prompt lines per industry, formatted once at import
+_CLICHE_AVOID_LINE: dict = {
+    key: f"**{key.replace('_', ' ').title()} — FORBIDDEN visuals:** {' / '.join(data['avoid'])}"
+    for key, data in INDUSTRY_CLICHES.items()
+}
+_CLICHE_LATERAL_LINES: dict = {
+    key: (
+        f"**{key.replace('_', ' ').title()} — creative territories:**",
+        *(f"  • {t}" for t in data["lateral"]),
+        "",
+    )
+    for key, data in INDUSTRY_CLICHES.items()
+}
 
-    This forces the Director to think beyond the obvious.
-    """
-    text_lower = (brief_text + " " + " ".join(brief_keywords or [])).lower()
 
-    # Find matching industries (may match more than one)
-    matched: dict = {}   # industry_key → cliché dict
+def _match_industries(text_lower: str) -> tuple:
+    """Return the industry keys mentioned in *text_lower*, in keyword-map order."""
+    hits = set()
+    for m in _INDUSTRY_KEYWORD_RE.finditer(text_lower):
+        keyword = m.group(1)
+        hits.add(keyword)
+        hits.update(_KEYWORD_SUBSUMES[keyword])
+    matched: list = []
     for keyword, industry_key in _INDUSTRY_KEYWORD_MAP.items():
-        if keyword in text_lower and industry_key not in matched:
-            matched[industry_key] = INDUSTRY_CLICHES[industry_key]
+        if keyword in hits and industry_key not in matched:
+            matched.append(industry_key)
+            if len(matched) == _INDUSTRY_COUNT:
+                break
+    return tuple(matched)
+
 
+@functools.lru_cache(maxsize=64)
+def _render_concept_constraints(matched: tuple) -> str:
+    """Build the constraint block for an ordered tuple of industry keys."""
     if not matched:
         return ""
 
@@ -685,10 +734,7 @@ def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
         "",
     ]
 
-    for industry_key, data in matched.items():
-        readable = industry_key.replace("_", " ").title()
-        avoid_str = " / ".join(data["avoid"])
-        lines.append(f"**{readable} — FORBIDDEN visuals:** {avoid_str}")
+    lines += [_CLICHE_AVOID_LINE[k] for k in matched]
 
     lines += [
         "",
@@ -699,12 +745,8 @@ def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
         "",
     ]
 
-    for industry_key, data in matched.items():
-        readable = industry_key.replace("_", " ").title()
-        lines.append(f"**{readable} — creative territories:**")
-        for t in data["lateral"]:
-            lines.append(f"  • {t}")
-        lines.append("")
+    for industry_key in matched:
+        lines += _CLICHE_LATERAL_LINES[industry_key]
 
     lines += [
         "## THE 4-DIRECTION DIVERSITY RULE",
@@ -722,6 +764,20 @@ def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
     return "\n".join(lines)
 
 
+def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
+    """
+    Analyse brief to identify industry, then return a constraint block with:
+    - Clichés to AVOID (hard rule)
+    - Lateral territories to EXPLORE (creative direction)
+
+    This forces the Director to think beyond the obvious. The block depends only
+    on which industries matched, so it is rendered once per industry combination
+    (refinement rounds on the same brief reuse it).
+    """
+    text_lower = (brief_text + " " + " ".join(brief_keywords or [])).lower()
+    return _render_concept_constraints(_match_industries(text_lower))
+
+
 # ── Concept ideation pre-pass REMOVED ─────────────────────────────────────────
 # Concept ideation is now handled internally by the Director system prompt
 # (Phase 1: CONCEPT IDEATION). The separate generate_concept_cores() call,
@@ -729,8 +785,97 @@ def _build_concept_constraints(brief_text: str, brief_keywords: list) -> str:
 # have been removed as dead code.
 
 
+# ── Reference images ──────────────────────────────────────────────────────────
+
+# Extension → MIME type for the formats the parser accepts (IMAGE_EXTS)
+_IMAGE_MIME = {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "webp": "image/webp"}
+
+
+@functools.lru_cache(maxsize=16)
+def _read_image_cached(path_str: str, mtime_ns: int, size: int) -> bytes:
+    return Path(path_str).read_bytes()
+
+
+def _read_image(path: Path) -> Optional[bytes]:
+    """
+    Read a moodboard / style-ref image, or None if it can't be read.
+
+    Bytes are cached on (path, mtime, size) so refinement rounds that resend the
+    same references skip the disk read, while an edited file is picked up again.
+    """
+    try:
+        st = path.stat()
+        return _read_image_cached(str(path), st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+
+# ── Gemini client ─────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> genai.Client:
+    """Shared Gemini client per API key, so refinement rounds reuse its connection pool."""
+    return genai.Client(api_key=api_key)
+
+
+# ── System prompt context cache ───────────────────────────────────────────────
+# SYSTEM_PROMPT is identical on every call, so it is uploaded once as an explicit
+# Gemini context cache and referenced by name; only the brief is sent per call.
+
+DIRECTOR_MODEL = "gemini-2.5-flash"
+_SYSTEM_CACHE_TTL_S = 3600
+# Content fingerprint of SYSTEM_PROMPT — tags the cache so entries created by an
+# older prompt revision are identifiable in `caches.list()`.
+_SYSTEM_PROMPT_DIGEST = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+_system_cache: dict = {}          # (api_key, model) → (cache name | None, expires_at)
+_system_cache_lock = threading.Lock()
+
+
+def _get_system_cache(client: genai.Client, api_key: str, model: str) -> Optional[str]:
+    """
+    Return the name of a context cache holding SYSTEM_PROMPT for this model,
+    creating it when missing or about to expire.
+
+    Returns None when explicit caching isn't available (e.g. tier/model limits);
+    that outcome is remembered for one TTL so we don't retry on every call, and
+    the caller sends the system prompt inline instead.
+    """
+    key = (api_key, model)
+    now = time.monotonic()
+    with _system_cache_lock:
+        entry = _system_cache.get(key)
+        if entry and entry[1] > now:
+            return entry[0]
+        try:
+            cache = client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=SYSTEM_PROMPT,
+                    display_name=f"brand-director-{_SYSTEM_PROMPT_DIGEST}",
+                    ttl=f"{_SYSTEM_CACHE_TTL_S}s",
+                ),
+            )
+            name = cache.name
+        except Exception as e:
+            console.print(f"  [dim]context cache unavailable, sending system prompt inline ({e})[/dim]")
+            name = None
+        # Refresh a minute early so a request never references an expiring cache
+        _system_cache[key] = (name, now + _SYSTEM_CACHE_TTL_S - 60)
+        return name
+
+
+def _drop_system_cache(api_key: str, model: str) -> None:
+    """Stop using the cached system prompt (e.g. it was evicted server-side)."""
+    with _system_cache_lock:
+        _system_cache[(api_key, model)] = (None, time.monotonic() + _SYSTEM_CACHE_TTL_S)
+
+
 # ── Director function ─────────────────────────────────────────────────────────
 
+_SECTION_DIVIDER = "\n\n---\n\n"
+
+
 def generate_directions(
     brief: BriefData,
     refinement_feedback: Optional[str] = None,
@@ -750,17 +895,19 @@ def generate_directions(
     Returns:
         Structured BrandDirectionsOutput with 4 directions
     """
-    client = genai.Client(api_key=os.environ["GEMINI_API_KEY"])
+    api_key = os.environ["GEMINI_API_KEY"]
+    client = _get_client(api_key)
 
-    user_message = brief.to_prompt_block()
+    # Prompt sections, joined once with the "---" divider at the end
+    sections = [brief.to_prompt_block()]
 
     if research_context:
-        user_message += f"\n\n---\n\n{research_context}"
+        sections.append(research_context)
 
     # ── Style ref instruction (all directions must render in same visual style) ─
     if style_ref_paths:
-        user_message += (
-            "\n\n---\n\n## ⭐ CRITICAL: STYLE REFERENCE — OVERRIDE RENDERING DECISIONS ⭐\n\n"
+        sections.append(
+            "## ⭐ CRITICAL: STYLE REFERENCE — OVERRIDE RENDERING DECISIONS ⭐\n\n"
             "The client has provided reference image(s) that define the EXACT visual rendering style.\n\n"
             "**MANDATORY for ALL 4 directions:**\n"
             "- `render_style` in each LogoSpec MUST describe the technique seen in the reference\n"
@@ -777,15 +924,15 @@ def generate_directions(
 
     # ── Inject anti-cliché + lateral territory constraints ────────────────────
     brief_kw = list(getattr(brief, "keywords", []) or [])
-    brief_txt = getattr(brief, "raw_text", "") or user_message
+    brief_txt = getattr(brief, "raw_text", "") or _SECTION_DIVIDER.join(sections)
     concept_constraints = _build_concept_constraints(brief_txt, brief_kw)
     if concept_constraints:
-        user_message += f"\n\n---\n\n{concept_constraints}"
+        sections.append(concept_constraints)
         console.print("  [dim]concept constraints injected (anti-cliché + lateral territories)[/dim]")
 
     if refinement_feedback:
-        user_message += (
-            f"\n\n---\n\n## ⭐ REFINEMENT REQUEST — MANDATORY TO FOLLOW ⭐\n\n"
+        sections.append(
+            f"## ⭐ REFINEMENT REQUEST — MANDATORY TO FOLLOW ⭐\n\n"
             f"{refinement_feedback}\n\n"
             "### HOW TO USE THIS FEEDBACK:\n"
             "- The user's feedback is ABOVE — it takes PRIORITY over the original brief.\n"
@@ -801,6 +948,8 @@ def generate_directions(
             "Be LITERAL about the requested visual changes — do not interpret loosely."
         )
 
+    user_message = _SECTION_DIVIDER.join(sections)
+
     console.print("\n[bold cyan]→ Gemini is analyzing the brief...[/bold cyan]")
 
     # ── Build contents: text + optional moodboard + style ref images ─────────
@@ -817,14 +966,21 @@ def generate_directions(
             all_images.append((p, "moodboard"))
 
     if all_images:
+        all_images = all_images[:10]
+        # Read all images concurrently — disk / network-FS reads overlap
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(all_images), 8)) as executor:
+            all_bytes = list(executor.map(_read_image, [p for p, _ in all_images]))
+
         parts = [types.Part.from_text(text=user_message)]
         loaded_style = 0
         loaded_mood  = 0
-        for img_path, img_role in all_images[:10]:
+        for (img_path, img_role), img_bytes in zip(all_images, all_bytes):
+            if img_bytes is None:
+                continue
             try:
-                img_bytes = img_path.read_bytes()
                 ext  = img_path.suffix.lower().lstrip(".")
-                mime = f"image/{'jpeg' if ext in ('jpg', 'jpeg') else ext or 'png'}"
+                mime = _IMAGE_MIME.get(ext) or f"image/{ext or 'png'}"
                 if img_role == "style_ref":
                     loaded_style += 1
                     label = (
@@ -852,41 +1008,49 @@ def generate_directions(
     # Stream response — show dots for progress, accumulate full JSON
     max_retries = 3
     for attempt in range(max_retries):
-        full_text = ""
+        chunks: List[str] = []
         char_count = 0
+        next_dot = 200
+        cache_name = _get_system_cache(client, api_key, DIRECTOR_MODEL)
         try:
             for chunk in client.models.generate_content_stream(
-                model="gemini-2.5-flash",
+                model=DIRECTOR_MODEL,
                 contents=contents,
                 config=types.GenerateContentConfig(
-                    system_instruction=SYSTEM_PROMPT,
+                    cached_content=cache_name,
+                    system_instruction=None if cache_name else SYSTEM_PROMPT,
                     response_mime_type="application/json",
-                    response_schema=BrandDirectionsOutput,
+                    response_schema=copy.deepcopy(_DIRECTIONS_JSON_SCHEMA),
                 ),
             ):
-                if chunk.text:
-                    full_text += chunk.text
-                    char_count += len(chunk.text)
-                    # Print a dot every ~200 chars so the user sees progress
-                    if char_count % 200 < len(chunk.text):
+                text = chunk.text
+                if text:
+                    chunks.append(text)
+                    char_count += len(text)
+                    # Print a dot each time another 200-char mark is passed
+                    if char_count >= next_dot:
+                        next_dot = char_count - char_count % 200 + 200
                         sys.stdout.write(".")
                         sys.stdout.flush()
         
             sys.stdout.write("\n")
             sys.stdout.flush()
         
-            if not full_text:
+            if not chunks:
                 raise ValueError("Gemini returned no content")
         
-            return BrandDirectionsOutput.model_validate_json(full_text)
+            return BrandDirectionsOutput.model_validate_json("".join(chunks))
             
         except Exception as e:
             sys.stdout.write("\n")
             err_str = str(e).lower()
+            if cache_name and "cache" in err_str and attempt < max_retries - 1:
+                # Cache expired or was evicted — fall back to the inline system prompt
+                _drop_system_cache(api_key, DIRECTOR_MODEL)
+                continue
             if "503" in err_str or "unavailable" in err_str or "overloaded" in err_str or "quota" in err_str:
                 if attempt < max_retries - 1:
                     console.print(f"  [yellow]⚠ Gemini API extremely busy (503). Retrying in 5 seconds... ({attempt + 1}/{max_retries})[/yellow]")
-                    import time
                     time.sleep(5)
                     continue
             raise e
@@ -894,6 +1058,14 @@ def generate_directions(
 
 # ── Display helpers ───────────────────────────────────────────────────────────
 
+_TYPE_COLORS = {
+    "Market-Aligned": "green",
+    "Designer-Led": "magenta",
+    "Hybrid": "yellow",
+    "Wild Card": "red",
+}
+
+
 def display_directions(output: BrandDirectionsOutput) -> None:
     """Pretty-print the 4 directions to the terminal."""
     console.print(
@@ -904,15 +1076,8 @@ def display_directions(output: BrandDirectionsOutput) -> None:
         )
     )
 
-    type_colors = {
-        "Market-Aligned": "green",
-        "Designer-Led": "magenta",
-        "Hybrid": "yellow",
-        "Wild Card": "red",
-    }
-
     for d in output.directions:
-        color = type_colors.get(d.option_type, "white")
+        color = _TYPE_COLORS.get(d.option_type, "white")
         palette_str = "  ".join(
             f"[bold]{s.name}[/bold] {s.hex}" for s in d.colors
         )
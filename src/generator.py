@@ -24,7 +24,7 @@ from google import genai
 from google.genai import types
 from rich.console import Console
 
-from .director import BrandDirection
+from .director import BrandDirection, TEXT_LOGO_TYPES
 
 console = Console()
 
@@ -576,8 +576,7 @@ def _logo_spec_to_prompt(spec, brand_name: str = "", style_dna: Optional[dict] =
     # Format: [SECTION]: comma-separated descriptors, ordered by attention priority.
     # Section order = attention priority (first section gets most weight).
 
-    TEXT_ALLOWED_TYPES = ("logotype", "combination")
-    is_text_type = logo_type_raw in TEXT_ALLOWED_TYPES
+    is_text_type = logo_type_raw in TEXT_LOGO_TYPES
 
     # [LOGO TYPE]: most important signal — what kind of mark
     type_label = logo_type_raw.replace("_", " ")
@@ -877,7 +876,7 @@ def _generate_direction_assets(
         if _logo_spec_obj and hasattr(_logo_spec_obj, "logo_type")
         else ""
     )
-    _logo_text_allowed = _logo_type_raw in ("logotype", "combination")
+    _logo_text_allowed = _logo_type_raw in TEXT_LOGO_TYPES
 
     # Log the translated prompt for debugging
     console.print(
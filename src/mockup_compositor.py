@@ -15,6 +15,7 @@ Per-mockup handlers dispatch on filename and apply specific art direction.
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import os
 import re
@@ -177,10 +178,14 @@ def _zones_to_text(zones: dict) -> str:
 
 # ── Basic colour helpers ───────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(h: str) -> Tuple[int, int, int]:
     h = h.strip("#")
     if len(h) == 3:
         h = h[0] * 2 + h[1] * 2 + h[2] * 2
+    if len(h) == 6:
+        v = int(h, 16)
+        return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
     return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
 
 
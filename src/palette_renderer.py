@@ -24,6 +24,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import math
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Union
@@ -48,6 +49,7 @@ _FONT_BOLD_CANDIDATES = [
 ]
 
 
+@functools.lru_cache(maxsize=64)
 def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     candidates = _FONT_BOLD_CANDIDATES if bold else _FONT_CANDIDATES
     for path in candidates:
@@ -60,11 +62,15 @@ def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
 
 # ── Color utilities ─────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_str: str) -> Tuple[int, int, int]:
     h = hex_str.strip("#")
     if len(h) == 3:
         h = h[0] * 2 + h[1] * 2 + h[2] * 2
     try:
+        if len(h) == 6:
+            v = int(h, 16)
+            return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
         return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
     except ValueError:
         return (128, 128, 128)